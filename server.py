@@ -1,10 +1,20 @@
+import asyncio
 import base64
+import re
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache, wraps
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.chromium.webdriver import ChromiumDriver
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.by import By
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 from mcp.server.fastmcp import FastMCP
@@ -14,20 +24,248 @@ mcp = FastMCP(
     instructions="This is a selenium-mcp service.",
 )
 
-state = {"drivers": {}, "current_session": None}
+# urllib3 defaults to one pooled connection per host, which serializes
+# concurrent commands to the same driver and logs "connection pool is full".
+_POOL_MAXSIZE = 20
+_original_get_connection_manager = RemoteConnection._get_connection_manager
+
+
+def _get_connection_manager(self):
+    manager = _original_get_connection_manager(self)
+    manager.connection_pool_kw["maxsize"] = _POOL_MAXSIZE
+    return manager
+
+
+RemoteConnection._get_connection_manager = _get_connection_manager
+
+
+@dataclass(slots=True)
+class SessionState:
+    drivers: dict = field(default_factory=dict)
+    current_session: str | None = None
+    current_driver: WebDriver | None = None
+
+
+state = SessionState()
+
+
+def browser_tool():
+    """
+    Registers a blocking tool that runs in a worker thread, so a long
+    WebDriver wait does not stall the event loop serving other calls.
+    """
+
+    def decorator(func):
+        @wraps(func)
+        async def run_in_thread(*args, **kwargs):
+            return await asyncio.to_thread(func, *args, **kwargs)
+
+        mcp.tool()(run_in_thread)
+        return func
+
+    return decorator
+
+
+# id/name/tag/class are resolved as CSS selectors, the same rewrite Selenium
+# applies internally, so every lookup takes the browser's CSS engine.
+_LOCATOR_MAP = {
+    "id": (By.CSS_SELECTOR, '[id="{}"]'),
+    "css": (By.CSS_SELECTOR, "{}"),
+    "xpath": (By.XPATH, "{}"),
+    "name": (By.CSS_SELECTOR, '[name="{}"]'),
+    "tag": (By.CSS_SELECTOR, "{}"),
+    "class": (By.CSS_SELECTOR, ".{}"),
+}
+
+# Leading tokens that are valid CSS but can never start an XPath expression,
+# so a mislabeled selector fails here instead of after a driver round-trip.
+_CSS_SELECTOR_RE = re.compile(r"^\s*(?:[#>~+\[]|\.[A-Za-z_-])")
+
+# Tools run in worker threads, so shared caches and session state are
+# updated under this lock.
+_lock = threading.Lock()
+
+# Per-driver LRU of WebDriverWait instances keyed by timeout in milliseconds.
+_WAIT_CACHE_SIZE = 8
+_wait_cache = {}
+
+# WebDriver's default script timeout; raised per driver when a wait needs more.
+_DEFAULT_SCRIPT_TIMEOUT_MS = 30000
+_script_timeouts = {}
+_script_timeout_lock = threading.Lock()
+
+# Scripts take the (strategy, selector) pair from get_locator, so they resolve
+# locators exactly like the WebDriver-based tools.
+_LOCATE_JS = """
+function locate(strategy, selector) {
+    if (strategy === "xpath") {
+        return document.evaluate(
+            selector, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+        ).singleNodeValue;
+    }
+    return document.querySelector(selector);
+}
+function isClickable(element) {
+    return (
+        !element.disabled &&
+        element.getClientRects().length > 0 &&
+        getComputedStyle(element).visibility !== "hidden"
+    );
+}
+"""
+
+_BATCH_ACTIONS_JS = _LOCATE_JS + """
+const steps = arguments[0];
+for (let i = 0; i < steps.length; i++) {
+    const step = steps[i];
+    const element = locate(step.strategy, step.selector);
+    if (!element) {
+        return {completed: i, error: "Element not found"};
+    }
+    if (step.op === "click") {
+        if (!isClickable(element)) {
+            return {completed: i, error: "Element not clickable"};
+        }
+        element.click();
+    } else if (step.op === "sendKeys") {
+        // Go through the native setter so frameworks that track the value
+        // (e.g. React) see the change when the input event fires.
+        const descriptor = Object.getOwnPropertyDescriptor(
+            Object.getPrototypeOf(element), "value"
+        );
+        if (!descriptor || !descriptor.set) {
+            return {completed: i, error: "Element does not accept text input"};
+        }
+        descriptor.set.call(element, step.text);
+        element.dispatchEvent(new Event("input", {bubbles: true}));
+        element.dispatchEvent(new Event("change", {bubbles: true}));
+    }
+}
+return {completed: steps.length, error: null};
+"""
+
+_CLICK_WHEN_READY_JS = _LOCATE_JS + """
+const [strategy, selector, timeout] = arguments;
+const done = arguments[arguments.length - 1];
+let finished = false;
+function finish(element, error) {
+    finished = true;
+    observer.disconnect();
+    clearInterval(interval);
+    clearTimeout(timer);
+    done({element: element, error: error});
+}
+function check() {
+    if (finished) {
+        return;
+    }
+    let element;
+    try {
+        element = locate(strategy, selector);
+    } catch (e) {
+        finish(null, String(e));
+        return;
+    }
+    if (element && isClickable(element)) {
+        finish(element, null);
+    }
+}
+// Mutations catch DOM changes; the interval catches style-only changes such
+// as transitions or late stylesheets.
+const observer = new MutationObserver(check);
+const interval = setInterval(check, 100);
+const timer = setTimeout(
+    () => finish(null, "Timed out waiting for element to be clickable"), timeout
+);
+observer.observe(document, {childList: true, subtree: true, attributes: true});
+check();
+"""
+
+_GET_TEXTS_JS = _LOCATE_JS + """
+return arguments[0].map(([strategy, selector]) => {
+    const element = locate(strategy, selector);
+    if (!element) {
+        return {found: false, text: null};
+    }
+    // innerText is undefined on non-HTML elements such as SVG text.
+    return {found: true, text: element.innerText ?? element.textContent};
+});
+"""
 
 
 def get_driver():
-    if state["current_session"] not in state["drivers"]:
+    driver = state.current_driver
+    if driver is None:
         raise Exception("No active browser session")
-    return state["drivers"][state["current_session"]]
+    return driver
+
+
+def get_wait(driver, timeout_ms):
+    """
+    Returns a WebDriverWait for the driver, reusing one per (driver, timeout) pair.
+    Keyed on milliseconds so the conversion to seconds only happens on a miss.
+    :param driver: The WebDriver instance to wait on.
+    :param timeout_ms: Maximum time to wait in milliseconds.
+    """
+    with _lock:
+        waits = _wait_cache.setdefault(id(driver), OrderedDict())
+        wait = waits.get(timeout_ms)
+        if wait is None:
+            wait = waits[timeout_ms] = WebDriverWait(driver, timeout_ms / 1000)
+            if len(waits) > _WAIT_CACHE_SIZE:
+                waits.popitem(last=False)
+        else:
+            waits.move_to_end(timeout_ms)
+    return wait
+
+
+def ensure_script_timeout(driver, timeout_ms):
+    """
+    Raises the driver's script timeout so an async script can run for timeout_ms.
+    :param driver: The WebDriver instance running the script.
+    :param timeout_ms: Time the script may wait in milliseconds.
+    """
+    # Leave headroom so the script reports its own timeout first.
+    needed = timeout_ms + 1000
+    if needed <= _script_timeouts.get(id(driver), _DEFAULT_SCRIPT_TIMEOUT_MS):
+        return
+    # Raises are ordered by their own lock so the RPC never holds up _lock.
+    with _script_timeout_lock:
+        if needed > _script_timeouts.get(id(driver), _DEFAULT_SCRIPT_TIMEOUT_MS):
+            driver.set_script_timeout(needed / 1000)
+            with _lock:
+                _script_timeouts[id(driver)] = needed
+
+
+def forget_driver(driver):
+    """
+    Drops any cached helpers bound to a driver that is being shut down.
+    :param driver: The WebDriver instance being released.
+    """
+    driver_id = id(driver)
+    with _lock:
+        _wait_cache.pop(driver_id, None)
+        _script_timeouts.pop(driver_id, None)
+
+
+def capture_screenshot(driver):
+    """
+    Captures the current page as base64-encoded PNG data.
+    Both CDP and the W3C endpoint return base64 (get_screenshot_as_png just
+    decodes it), so callers decode this once when they need bytes.
+    :param driver: The WebDriver instance to capture.
+    """
+    if isinstance(driver, ChromiumDriver):
+        result = driver.execute_cdp_cmd("Page.captureScreenshot", {"format": "png"})
+        return result["data"]
+    return driver.get_screenshot_as_base64()
 
 
 def generate_session_id(browser):
     return f"{browser}_{int(time.time() * 1000)}"
 
 
-@mcp.tool()
+@browser_tool()
 def start_browser(browser: str, headless: bool = False, arguments: list[str] = None):
     """
     Start a browser (supports Chrome and Firefox)
@@ -59,8 +297,10 @@ def start_browser(browser: str, headless: bool = False, arguments: list[str] = N
             driver = webdriver.Firefox(options=firefox_options)
 
         session_id = generate_session_id(browser)
-        state["drivers"][session_id] = driver
-        state["current_session"] = session_id
+        with _lock:
+            state.drivers[session_id] = driver
+            state.current_session = session_id
+            state.current_driver = driver
 
         return f"Browser started with session_id: {session_id}"
 
@@ -68,7 +308,7 @@ def start_browser(browser: str, headless: bool = False, arguments: list[str] = N
         return f"Error starting browser: {str(e)}"
 
 
-@mcp.tool()
+@browser_tool()
 def navigate(url: str):
     """
     Navigates the browser to a specified URL.
@@ -85,23 +325,7 @@ def navigate(url: str):
         return f"Error navigating: {str(e)}"
 
 
-@mcp.tool()
-def close_session():
-    """
-    Close the current browser session
-    """
-    try:
-        driver = get_driver()
-        driver.quit()
-        session_id = state["current_session"]
-        del state["drivers"][session_id]
-        state["current_session"] = None
-        return f"Browser session {session_id} closed"
-    except Exception as e:
-        return f"Error closing session: {str(e)}"
-
-
-@mcp.tool()
+@browser_tool()
 def find_element(by: str, value: str, timeout: int = 10000):
     """
     Finds an element on the page.
@@ -111,10 +335,9 @@ def find_element(by: str, value: str, timeout: int = 10000):
     """
     try:
         driver = get_driver()
-        timeout_seconds = timeout / 1000
 
-        element = WebDriverWait(driver, timeout_seconds).until(
-            EC.presence_of_element_located((get_locator(by), value))
+        element = get_wait(driver, timeout).until(
+            EC.presence_of_element_located(get_locator(by, value))
         )
 
         return f"Element found using {by}='{value}'"
@@ -123,26 +346,36 @@ def find_element(by: str, value: str, timeout: int = 10000):
         return f"Error finding element: {str(e)}"
 
 
-def get_locator(by: str):
+@lru_cache(maxsize=32)
+def get_strategy(by: str):
     """
-    Maps the locator strategy to Selenium's By class.
+    Maps the locator strategy to a Selenium By value and a selector template.
     :param by: Locator strategy (e.g., "id", "css", "xpath", etc.).
-    :return: Corresponding Selenium By object.
-    """
-    locator_map = {
-        "id": By.ID,
-        "css": By.CSS_SELECTOR,
-        "xpath": By.XPATH,
-        "name": By.NAME,
-        "tag": By.TAG_NAME,
-        "class": By.CLASS_NAME,
-    }
-    if by.lower() not in locator_map:
+    :return: Tuple of the Selenium By value and the template for the selector.
+    """
+    strategy = _LOCATOR_MAP.get(by.lower())
+    if strategy is None:
         raise ValueError(f"Unsupported locator strategy: {by}")
-    return locator_map[by.lower()]
+    return strategy
+
+
+@lru_cache(maxsize=1024)
+def get_locator(by: str, value: str):
+    """
+    Builds the Selenium locator for a strategy and value.
+    :param by: Locator strategy (e.g., "id", "css", "xpath", etc.).
+    :param value: The value for the locator strategy.
+    :return: Tuple of the Selenium By value and the selector to pass with it.
+    """
+    strategy, template = get_strategy(by)
+    if strategy == By.XPATH and _CSS_SELECTOR_RE.match(value):
+        raise ValueError(
+            f"Invalid XPath expression, looks like a CSS selector: {value}"
+        )
+    return strategy, template.format(value)
 
 
-@mcp.tool()
+@browser_tool()
 def click_element(by: str, value: str, timeout: int = 10000):
     """
     Clicks an element on the page.
@@ -152,12 +385,17 @@ def click_element(by: str, value: str, timeout: int = 10000):
     """
     try:
         driver = get_driver()
-        timeout_seconds = timeout / 1000
+        strategy, selector = get_locator(by, value)
 
-        element = WebDriverWait(driver, timeout_seconds).until(
-            EC.element_to_be_clickable((get_locator(by), value))
+        # Wait in the browser instead of one clickability RPC per poll, then
+        # click through WebDriver so real pointer events fire.
+        ensure_script_timeout(driver, timeout)
+        result = driver.execute_async_script(
+            _CLICK_WHEN_READY_JS, strategy, selector, timeout
         )
-        element.click()
+        if result["error"]:
+            raise Exception(result["error"])
+        result["element"].click()
 
         return f"Element clicked using {by}='{value}'"
 
@@ -165,7 +403,7 @@ def click_element(by: str, value: str, timeout: int = 10000):
         return f"Error clicking element: {str(e)}"
 
 
-@mcp.tool()
+@browser_tool()
 def send_keys(by: str, value: str, text: str, timeout: int = 10000):
     """
     Sends keys to an element (typing).
@@ -176,10 +414,9 @@ def send_keys(by: str, value: str, text: str, timeout: int = 10000):
     """
     try:
         driver = get_driver()
-        timeout_seconds = timeout / 1000
 
-        element = WebDriverWait(driver, timeout_seconds).until(
-            EC.presence_of_element_located((get_locator(by), value))
+        element = get_wait(driver, timeout).until(
+            EC.presence_of_element_located(get_locator(by, value))
         )
         element.clear()
         element.send_keys(text)
@@ -190,7 +427,51 @@ def send_keys(by: str, value: str, text: str, timeout: int = 10000):
         return f"Error entering text: {str(e)}"
 
 
-@mcp.tool()
+@browser_tool()
+def batch_actions(steps: list[dict]):
+    """
+    Runs several click/type steps in a single browser round-trip.
+    Elements are looked up without waiting, so they must already be on the page.
+    :param steps: Steps to run in order, e.g. {"op": "click", "by": "css", "value": "#a"}
+        or {"op": "sendKeys", "by": "id", "value": "u", "text": "x"}.
+    """
+    try:
+        driver = get_driver()
+
+        payload = []
+        for index, step in enumerate(steps):
+            op = step.get("op")
+            if op not in ("click", "sendKeys"):
+                raise ValueError(f"Unsupported batch operation in step {index}: {op}")
+            required = ("by", "value", "text") if op == "sendKeys" else ("by", "value")
+            missing = [key for key in required if step.get(key) is None]
+            if missing:
+                raise ValueError(f"Step {index} ({op}) is missing {', '.join(missing)}")
+            strategy, selector = get_locator(step["by"], step["value"])
+            payload.append(
+                {
+                    "op": op,
+                    "strategy": strategy,
+                    "selector": selector,
+                    "text": step.get("text"),
+                }
+            )
+
+        result = driver.execute_script(_BATCH_ACTIONS_JS, payload)
+        if result["error"]:
+            failed = steps[result["completed"]]
+            return (
+                f"Batch stopped after {result['completed']} of {len(steps)} steps: "
+                f"{result['error']} using {failed['by']}='{failed['value']}'"
+            )
+
+        return f"Batch completed {len(steps)} steps"
+
+    except Exception as e:
+        return f"Error running batch actions: {str(e)}"
+
+
+@browser_tool()
 def get_element_text(by: str, value: str, timeout: int = 10000):
     """
     Gets the text of an element.
@@ -200,10 +481,9 @@ def get_element_text(by: str, value: str, timeout: int = 10000):
     """
     try:
         driver = get_driver()
-        timeout_seconds = timeout / 1000
 
-        element = WebDriverWait(driver, timeout_seconds).until(
-            EC.presence_of_element_located((get_locator(by), value))
+        element = get_wait(driver, timeout).until(
+            EC.presence_of_element_located(get_locator(by, value))
         )
         text = element.text
 
@@ -213,7 +493,32 @@ def get_element_text(by: str, value: str, timeout: int = 10000):
         return f"Error getting element text: {str(e)}"
 
 
-@mcp.tool()
+@browser_tool()
+def get_texts_batch(locators: list[tuple[str, str]]):
+    """
+    Gets the text of several elements in a single browser round-trip.
+    Elements are looked up without waiting, so they must already be on the page.
+    :param locators: (by, value) pairs, e.g. [["css", "h1"], ["id", "price"]].
+    """
+    try:
+        driver = get_driver()
+
+        payload = [list(get_locator(by, value)) for by, value in locators]
+        results = driver.execute_script(_GET_TEXTS_JS, payload)
+
+        lines = []
+        for (by, value), result in zip(locators, results):
+            if result["found"]:
+                lines.append(f"{by}='{value}': {result['text']}")
+            else:
+                lines.append(f"{by}='{value}': Element not found")
+        return "Texts of elements:\n" + "\n".join(lines)
+
+    except Exception as e:
+        return f"Error getting element texts: {str(e)}"
+
+
+@browser_tool()
 def hover(by: str, value: str, timeout: int = 10000):
     """
     Hovers over an element.
@@ -223,10 +528,9 @@ def hover(by: str, value: str, timeout: int = 10000):
     """
     try:
         driver = get_driver()
-        timeout_seconds = timeout / 1000
 
-        element = WebDriverWait(driver, timeout_seconds).until(
-            EC.presence_of_element_located((get_locator(by), value))
+        element = get_wait(driver, timeout).until(
+            EC.presence_of_element_located(get_locator(by, value))
         )
         actions = ActionChains(driver)
         actions.move_to_element(element).perform()
@@ -237,7 +541,7 @@ def hover(by: str, value: str, timeout: int = 10000):
         return f"Error hovering over element: {str(e)}"
 
 
-@mcp.tool()
+@browser_tool()
 def drag_and_drop(
     by: str, value: str, target_by: str, target_value: str, timeout: int = 10000
 ):
@@ -251,13 +555,12 @@ def drag_and_drop(
     """
     try:
         driver = get_driver()
-        timeout_seconds = timeout / 1000
 
-        source_element = WebDriverWait(driver, timeout_seconds).until(
-            EC.presence_of_element_located((get_locator(by), value))
+        source_element = get_wait(driver, timeout).until(
+            EC.presence_of_element_located(get_locator(by, value))
         )
-        target_element = WebDriverWait(driver, timeout_seconds).until(
-            EC.presence_of_element_located((get_locator(target_by), target_value))
+        target_element = get_wait(driver, timeout).until(
+            EC.presence_of_element_located(get_locator(target_by, target_value))
         )
 
         actions = ActionChains(driver)
@@ -269,7 +572,7 @@ def drag_and_drop(
         return f"Error performing drag and drop: {str(e)}"
 
 
-@mcp.tool()
+@browser_tool()
 def double_click(by: str, value: str, timeout: int = 10000):
     """
     Performs a double click on an element.
@@ -279,10 +582,9 @@ def double_click(by: str, value: str, timeout: int = 10000):
     """
     try:
         driver = get_driver()
-        timeout_seconds = timeout / 1000
 
-        element = WebDriverWait(driver, timeout_seconds).until(
-            EC.presence_of_element_located((get_locator(by), value))
+        element = get_wait(driver, timeout).until(
+            EC.presence_of_element_located(get_locator(by, value))
         )
         actions = ActionChains(driver)
         actions.double_click(element).perform()
@@ -293,7 +595,7 @@ def double_click(by: str, value: str, timeout: int = 10000):
         return f"Error performing double click: {str(e)}"
 
 
-@mcp.tool()
+@browser_tool()
 def right_click(by: str, value: str, timeout: int = 10000):
     """
     Performs a right click (context click) on an element.
@@ -303,10 +605,9 @@ def right_click(by: str, value: str, timeout: int = 10000):
     """
     try:
         driver = get_driver()
-        timeout_seconds = timeout / 1000
 
-        element = WebDriverWait(driver, timeout_seconds).until(
-            EC.presence_of_element_located((get_locator(by), value))
+        element = get_wait(driver, timeout).until(
+            EC.presence_of_element_located(get_locator(by, value))
         )
         actions = ActionChains(driver)
         actions.context_click(element).perform()
@@ -317,7 +618,7 @@ def right_click(by: str, value: str, timeout: int = 10000):
         return f"Error performing right click: {str(e)}"
 
 
-@mcp.tool()
+@browser_tool()
 def press_key(key: str):
     """
     Simulates pressing a keyboard key.
@@ -326,6 +627,8 @@ def press_key(key: str):
     try:
         driver = get_driver()
         actions = ActionChains(driver)
+        # key_down/key_up go out together in one W3C actions command; CDP
+        # Input.dispatchKeyEvent would need a separate call for each event.
         actions.key_down(key).key_up(key).perform()
 
         return f"Key '{key}' pressed"
@@ -334,7 +637,7 @@ def press_key(key: str):
         return f"Error pressing key: {str(e)}"
 
 
-@mcp.tool()
+@browser_tool()
 def upload_file(by: str, value: str, file_path: str, timeout: int = 10000):
     """
     Uploads a file using a file input element.
@@ -345,10 +648,9 @@ def upload_file(by: str, value: str, file_path: str, timeout: int = 10000):
     """
     try:
         driver = get_driver()
-        timeout_seconds = timeout / 1000
 
-        element = WebDriverWait(driver, timeout_seconds).until(
-            EC.presence_of_element_located((get_locator(by), value))
+        element = get_wait(driver, timeout).until(
+            EC.presence_of_element_located(get_locator(by, value))
         )
         element.send_keys(file_path)
 
@@ -358,7 +660,7 @@ def upload_file(by: str, value: str, file_path: str, timeout: int = 10000):
         return f"Error uploading file: {str(e)}"
 
 
-@mcp.tool()
+@browser_tool()
 def take_screenshot(output_path: str = None):
     """
     Captures a screenshot of the current page.
@@ -366,7 +668,7 @@ def take_screenshot(output_path: str = None):
     """
     try:
         driver = get_driver()
-        screenshot = driver.get_screenshot_as_base64()
+        screenshot = capture_screenshot(driver)
 
         if output_path:
             with open(output_path, "wb") as file:
@@ -379,17 +681,22 @@ def take_screenshot(output_path: str = None):
         return f"Error taking screenshot: {str(e)}"
 
 
-@mcp.tool()
+@browser_tool()
 def close_session():
     """
     Closes the current browser session.
     """
     try:
-        driver = get_driver()
-        driver.quit()
-        session_id = state["current_session"]
-        del state["drivers"][session_id]
-        state["current_session"] = None
+        with _lock:
+            driver = get_driver()
+            session_id = state.current_session
+            del state.drivers[session_id]
+            state.current_session = None
+            state.current_driver = None
+        try:
+            driver.quit()
+        finally:
+            forget_driver(driver)
 
         return f"Browser session {session_id} closed"
 
@@ -397,14 +704,24 @@ def close_session():
         return f"Error closing session: {str(e)}"
 
 
+def _safe_quit(session):
+    session_id, driver = session
+    try:
+        driver.quit()
+    except Exception as e:
+        print(f"Error closing browser session {session_id}: {e}")
+
+
 def cleanup():
     """
     Cleans up all active browser sessions.
     """
-    for session_id, driver in state["drivers"].items():
-        try:
-            driver.quit()
-        except Exception as e:
-            print(f"Error closing browser session {session_id}: {e}")
-    state["drivers"].clear()
-    state["current_session"] = None
+    with _lock:
+        sessions = list(state.drivers.items())
+        state.drivers.clear()
+        state.current_session = None
+        state.current_driver = None
+        _wait_cache.clear()
+        _script_timeouts.clear()
+    with ThreadPoolExecutor(max_workers=len(sessions) or 1) as executor:
+        list(executor.map(_safe_quit, sessions))